@@ -3,10 +3,17 @@ import subprocess
 import sys
 import os
 import re
-import datetime
-import string
+import json
+import functools
 import time
 import shutil
+import threading
+import concurrent.futures
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 # ==========================================================
 # TRON COLOR THEME
@@ -24,14 +31,25 @@ RED     = "\033[91m"
 
 SEP = f"{CYAN}{DIM}" + "━" * 48 + RESET
 
+# Formatting is split from printing so multi-line screens can be
+# joined into a single sys.stdout.write instead of one flush per line.
+def fmt_header(title):
+    return f"\n{SEP}\n{CYAN_B}{BOLD}▣ {title}{RESET}\n{SEP}\n"
+
+def fmt_section(title):
+    return f"\n{CYAN_B}{BOLD}{title}{RESET}\n"
+
+def fmt_kv(k, v):
+    return f"  {BLUE}{k:<8}{RESET}: {WHITE}{v}{RESET}\n"
+
 def header(title):
-    print(f"\n{SEP}\n{CYAN_B}{BOLD}▣ {title}{RESET}\n{SEP}")
+    sys.stdout.write(fmt_header(title))
 
 def section(title):
-    print(f"\n{CYAN_B}{BOLD}{title}{RESET}")
+    sys.stdout.write(fmt_section(title))
 
 def kv(k, v):
-    print(f"  {BLUE}{k:<8}{RESET}: {WHITE}{v}{RESET}")
+    sys.stdout.write(fmt_kv(k, v))
 
 def info(msg): print(f"{CYAN}{msg}{RESET}")
 def warn(msg): print(f"{YELLOW}{msg}{RESET}")
@@ -52,8 +70,23 @@ def safe(argv):
     except Exception:
         return ""
 
+def parallel_safe(cmds):
+    # Independent read-only git calls are fork/exec-bound, not CPU-bound,
+    # so running them through a thread pool collapses total latency to
+    # the slowest call.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(safe, cmds))
+
+_SEMVER_RE = re.compile(r"v(\d+)\.(\d+)\.(\d+)")
+# Snapshot the environment once; commit/tag runs overlay the GIT_*
+# identity keys on this instead of re-copying os.environ each time.
+_BASE_ENV = os.environ.copy()
+# Printable ASCII minus whitespace — one C-level scan instead of a
+# per-character Python loop.
+_NON_PRINTABLE_RE = re.compile(r"[^\x21-\x7e]")
+
 def is_printable_no_space(s):
-    return s and all(c in string.printable and not c.isspace() for c in s)
+    return bool(s) and _NON_PRINTABLE_RE.search(s) is None
 
 def clamp_timeout(val, default="12"):
     try:
@@ -62,14 +95,166 @@ def clamp_timeout(val, default="12"):
     except Exception:
         return default
 
+# ==========================================================
+# GIT REPOSITORY ACCESS
+# ==========================================================
+# Read-only queries go through libgit2 (pygit2) when available: one
+# in-process Repository handle replaces a fork+exec per git call.
+# Mutations (add/commit/tag/push) always go through the git binary.
+_REPO = None
+
+def open_repo():
+    global _REPO
+    if pygit2 is None:
+        return None
+    if _REPO is None:
+        try:
+            path = pygit2.discover_repository(".")
+            if path is None:
+                return None
+            _REPO = pygit2.Repository(path)
+        except Exception:
+            return None
+    return _REPO
+
+def inside_work_tree():
+    if open_repo() is not None:
+        return True
+    return safe(["git", "rev-parse", "--is-inside-work-tree"]) == "true"
+
+def has_remote():
+    repo = open_repo()
+    if repo is not None:
+        return len(list(repo.remotes)) > 0
+    return bool(safe(["git", "remote"]))
+
+def current_branch():
+    repo = open_repo()
+    if repo is not None:
+        try:
+            if not repo.head_is_unborn and not repo.head_is_detached:
+                return repo.head.shorthand
+        except Exception:
+            pass
+        return ""
+    return safe(["git", "branch", "--show-current"])
+
+FETCH_CACHE = os.path.expanduser("~/.cache/gitgo/fetch.json")
+FETCH_FRESH_WINDOW = 30  # seconds; rapid re-runs skip the refetch
+
+def _upstream_key():
+    # Per-clone key: the same remote URL in two clones must not share
+    # freshness stamps.
+    repo = open_repo()
+    if repo is not None:
+        gitdir = repo.path
+        try:
+            url = repo.remotes["origin"].url or ""
+        except Exception:
+            url = ""
+    else:
+        gitdir = os.path.abspath(safe(["git", "rev-parse", "--git-dir"]))
+        url = safe(["git", "remote", "get-url", "origin"])
+    return f"{gitdir}:{url}"
+
+def _recently_fetched():
+    try:
+        with open(FETCH_CACHE) as f:
+            stamps = json.load(f)
+        return time.time() - stamps.get(_upstream_key(), 0) < FETCH_FRESH_WINDOW
+    except Exception:
+        return False
+
+def _record_fetch():
+    stamps = {}
+    try:
+        with open(FETCH_CACHE) as f:
+            stamps = json.load(f)
+    except Exception:
+        pass
+    stamps[_upstream_key()] = time.time()
+    try:
+        os.makedirs(os.path.dirname(FETCH_CACHE), exist_ok=True)
+        with open(FETCH_CACHE, "w") as f:
+            json.dump(stamps, f)
+    except Exception:
+        pass
+
+def start_background_fetch():
+    # Kick off the network round-trip immediately so it overlaps the
+    # dashboard and review interaction instead of blocking before push.
+    if not has_remote() or _recently_fetched():
+        return None
+    try:
+        proc = subprocess.Popen(["git", "fetch", "--quiet"],
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+    except Exception:
+        return None
+    _record_fetch()
+    return proc
+
+def behind_upstream():
+    out = safe(["git", "rev-list", "--count", "HEAD..@{upstream}"])
+    return int(out) if out.isdigit() else 0
+
+def _parse_status_v2(out):
+    staged, unstaged, untracked = [], [], []
+    fields = iter(out.split("\0"))
+    for rec in fields:
+        if not rec: continue
+        kind = rec[0]
+        if kind == "1":
+            xy = rec.split(" ", 2)[1]
+            path = rec.split(" ", 8)[8]
+            if xy[0] != ".": staged.append(path)
+            if xy[1] != ".": unstaged.append(path)
+        elif kind == "2":
+            xy = rec.split(" ", 2)[1]
+            path = rec.split(" ", 9)[9]
+            next(fields, None)  # rename records carry the original path
+            if xy[0] != ".": staged.append(path)
+            if xy[1] != ".": unstaged.append(path)
+        elif kind == "u":
+            unstaged.append(rec.split(" ", 10)[10])
+        elif kind == "?":
+            untracked.append(rec[2:])
+    return staged, unstaged, untracked
+
+def scan_status():
+    # One repo-wide index+worktree scan; every caller derives what it
+    # needs from the parsed result instead of re-running git status.
+    out = subprocess.run(
+        ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"],
+        capture_output=True, text=True).stdout
+    return _parse_status_v2(out)
+
+def last_tag():
+    repo = open_repo()
+    if repo is not None:
+        try:
+            return repo.describe(describe_strategy=pygit2.GIT_DESCRIBE_TAGS,
+                                 abbreviated_size=0)
+        except Exception:
+            return ""
+    return safe(["git", "describe", "--tags", "--abbrev=0"])
+
 # ==========================================================
 # GIT CONFIG & IDENTITY
 # ==========================================================
+@functools.lru_cache(maxsize=64)
 def git_config(key):
+    repo = open_repo()
+    if repo is not None:
+        try:
+            return str(repo.config[key])
+        except Exception:
+            return ""
     return safe(["git", "config", key])
 
 def git_config_set(key, value):
     run(["git", "config", "--local", key, value])
+    git_config.cache_clear()
 
 def read_identity():
     n = git_config("user.name")
@@ -89,11 +274,49 @@ def prompt_identity(n, e):
 # ==========================================================
 # AI HELPERS
 # ==========================================================
+MODELS_CACHE = os.path.expanduser("~/.cache/gitgo/models.json")
+MODELS_CACHE_TTL = 24 * 3600  # llm's model list changes rarely
+
+# Resolve the llm binary once; every AI path gates on this instead of
+# re-searching PATH or paying a fork+exec just to hit ENOENT.
+LLM_BIN = shutil.which("llm")
+
 def has_llm():
-    return shutil.which("llm") is not None
+    return LLM_BIN is not None
+
+def _load_models_cache(llm_mtime):
+    try:
+        with open(MODELS_CACHE) as f:
+            cached = json.load(f)
+        if (cached.get("mtime") == llm_mtime
+                and time.time() - cached.get("cached_at", 0) < MODELS_CACHE_TTL):
+            return cached["models"]
+    except Exception:
+        pass
+    return None
+
+def _save_models_cache(llm_mtime, models):
+    try:
+        os.makedirs(os.path.dirname(MODELS_CACHE), exist_ok=True)
+        with open(MODELS_CACHE, "w") as f:
+            json.dump({"mtime": llm_mtime, "cached_at": time.time(),
+                       "models": models}, f)
+    except Exception:
+        pass
 
 def list_llm_models():
-    out = safe(["llm", "models"])
+    # 'llm models' costs 100+ ms per run; cache it on disk, keyed by the
+    # llm binary's mtime so upgrades invalidate the cache.
+    if LLM_BIN is None:
+        return []
+    try:
+        llm_mtime = os.path.getmtime(LLM_BIN)
+    except OSError:
+        llm_mtime = 0
+    cached = _load_models_cache(llm_mtime)
+    if cached is not None:
+        return cached
+    out = safe([LLM_BIN, "models"])
     models = []
     for line in out.splitlines():
         line = line.strip()
@@ -102,6 +325,7 @@ def list_llm_models():
         model_id = core.split(":")[-1].strip()
         if is_printable_no_space(model_id):
             models.append({"id": model_id, "label": line})
+    _save_models_cache(llm_mtime, models)
     return models
 
 def pick_model(models):
@@ -118,23 +342,67 @@ def pick_model(models):
     return models[int(c)-1] if c.isdigit() and int(c) in (1, 2) else models[0]
 
 def wait_with_countdown(proc, timeout):
-    remaining = int(timeout)
-    while remaining > 0:
-        if proc.poll() is not None: return True
+    # wait(timeout=1) returns the instant the child exits, unlike the
+    # old poll-then-sleep loop that burned up to 1s after completion.
+    for remaining in range(int(timeout), 0, -1):
         print(f"\r{CYAN}AI generating… {remaining}s remaining{RESET}{' '*20}", end="", flush=True)
-        time.sleep(1)
-        remaining -= 1
+        try:
+            proc.wait(timeout=1)
+            return True
+        except subprocess.TimeoutExpired:
+            continue
     return False
 
+def staged_diff(byte_limit=15000, line_limit=800):
+    # Stream the diff line by line and stop at whichever cap hits
+    # first. Whole-line truncation never cuts a multi-byte sequence in
+    # half, and peak memory stays bounded by the caps.
+    try:
+        p = subprocess.Popen(["git", "diff", "--cached", "--unified=0"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             text=True, errors="replace")
+        lines, total = [], 0
+        for line in p.stdout:
+            lines.append(line)
+            total += len(line)
+            if total > byte_limit or len(lines) > line_limit:
+                break
+        p.stdout.close()
+        p.kill()
+        p.wait()
+        return "".join(lines)
+    except Exception:
+        return ""
+
+def _drain(stream, sink):
+    try:
+        sink.append(stream.read())
+    except Exception:
+        sink.append("")
+
 def generate_ai_message(model_id, timeout):
-    diff = safe(["git", "diff", "--cached", "--unified=0"])[:15000]
+    if LLM_BIN is None:
+        return None, "llm not installed"
+    diff = staged_diff()
     prompt = f"Improve this Git commit message. Rules: FIRST line ≤ 72 chars. No invented details.\n\nDiff:\n{diff}"
     try:
-        p = subprocess.Popen(["llm", "-m", model_id, prompt], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Pipe the prompt through stdin: a multi-KB diff in argv risks
+        # E2BIG and gets copied into the exec envelope for nothing.
+        p = subprocess.Popen([LLM_BIN, "-m", model_id], stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        p.stdin.write(prompt)
+        p.stdin.close()
+        # Drain both pipes while we wait; otherwise a chatty child fills
+        # the 64 kB pipe buffer and blocks until the late communicate().
+        out_buf, err_buf = [], []
+        readers = [threading.Thread(target=_drain, args=(p.stdout, out_buf), daemon=True),
+                   threading.Thread(target=_drain, args=(p.stderr, err_buf), daemon=True)]
+        for t in readers: t.start()
         if wait_with_countdown(p, timeout):
-            out, err = p.communicate()
-            if out.strip(): return enforce_summary_limit(out.strip()), None
-            return None, err.strip() or "Empty output"
+            for t in readers: t.join()
+            out = "".join(out_buf).strip()
+            if out: return enforce_summary_limit(out), None
+            return None, "".join(err_buf).strip() or "Empty output"
         p.kill()
         return None, "Timeout"
     except Exception as e:
@@ -143,13 +411,22 @@ def generate_ai_message(model_id, timeout):
 # ==========================================================
 # VERSIONING
 # ==========================================================
-def tag_exists(tag):
-    return subprocess.call(["git", "show-ref", "--tags", "--verify", "--quiet", f"refs/tags/{tag}"]) == 0
-
-def next_free_version(major, minor, patch):
+def list_tags():
+    # One batched query for every tag instead of one git spawn per
+    # candidate in next_free_version.
+    repo = open_repo()
+    if repo is not None:
+        return {r[len("refs/tags/"):] for r in repo.references
+                if r.startswith("refs/tags/")}
+    out = safe(["git", "for-each-ref", "--format=%(refname:short)", "refs/tags/"])
+    return set(out.splitlines())
+
+def next_free_version(major, minor, patch, existing=None):
+    if existing is None:
+        existing = list_tags()
     while True:
         candidate = f"v{major}.{minor}.{patch+1}"
-        if not tag_exists(candidate): return candidate
+        if candidate not in existing: return candidate
         patch += 1
 
 def enforce_summary_limit(msg, limit=72):
@@ -166,51 +443,59 @@ def enforce_summary_limit(msg, limit=72):
 # CORE WORKFLOW
 # ==========================================================
 def check_env():
-    if safe(["git", "rev-parse", "--is-inside-work-tree"]) != "true":
+    if not inside_work_tree():
         warn("Not a Git repository.")
         if input(f"{BLUE}Initialize? [y/N]: {RESET}").lower() == 'y':
             run(["git", "init"])
         else: sys.exit(0)
-    
-    if not safe(["git", "remote"]):
+
+    if not has_remote():
         warn("No remote origin.")
         url = input(f"{BLUE}Remote URL (blank to skip): {RESET}").strip()
         if url:
             try:
                 run(["git", "ls-remote", url], capture=True, timeout=10)
-                run(["git", "remote", add, "origin", url])
+                run(["git", "remote", "add", "origin", url])
             except Exception:
                 error("Invalid remote. Exiting."); sys.exit(1)
 
 def main():
     check_env()
-    
+    fetch_proc = start_background_fetch()
+
     # Dashboard info
     name, email, source = read_identity()
     model_id = git_config("gitgo.model")
     timeout = clamp_timeout(git_config("gitgo.timeout"))
 
-    header("GITGO :: STATUS")
-    kv("Identity", f"{name} <{email}> ({source})")
-    kv("Model", model_id or "default")
-    kv("Branch", safe(["git", "branch", "--show-current"]))
-    
-    section("REMOTE")
-    print(f"  {safe(['git', 'remote', '-v'])}")
-
-    section("HISTORY")
-    print(f"  {safe(['git', 'log', '-2', '--oneline'])}")
+    remote_info, history = parallel_safe([
+        ["git", "remote", "-v"],
+        ["git", "log", "-2", "--oneline"],
+    ])
+
+    sys.stdout.write("".join([
+        fmt_header("GITGO :: STATUS"),
+        fmt_kv("Identity", f"{name} <{email}> ({source})"),
+        fmt_kv("Model", model_id or "default"),
+        fmt_kv("Branch", current_branch()),
+        fmt_section("REMOTE"),
+        f"  {remote_info}\n",
+        fmt_section("HISTORY"),
+        f"  {history}\n",
+    ]))
 
     if input(f"\n{BLUE}Proceed to commit? [Y/n]: {RESET}").lower() == 'n': sys.exit(0)
 
-    # Prepare changes
-    run(["git", "add", "."])
-    if not safe(["git", "status", "--porcelain"]):
+    # Prepare changes — check cleanliness first so a no-op run skips
+    # the full working-tree scan that 'git add .' does.
+    staged, unstaged, untracked = scan_status()
+    if not (staged or unstaged or untracked):
         success("Nothing to commit."); sys.exit(0)
+    run(["git", "add", "."])
 
     # Resolve Version
-    last = safe(["git", "describe", "--tags", "--abbrev=0"]) or "v0.0.0"
-    m = re.match(r"v(\d+)\.(\d+)\.(\d+)", last)
+    last = last_tag() or "v0.0.0"
+    m = _SEMVER_RE.match(last)
     major, minor, patch = map(int, m.groups()) if m else (0, 0, 0)
     next_version = next_free_version(major, minor, patch)
 
@@ -264,17 +549,26 @@ def main():
         elif c == "6": sys.exit(0)
 
     # Final Execution
-    env = os.environ.copy()
-    env.update({"GIT_AUTHOR_NAME": name, "GIT_AUTHOR_EMAIL": email, "GIT_COMMITTER_NAME": name, "GIT_COMMITTER_EMAIL": email})
+    env = {**_BASE_ENV, "GIT_AUTHOR_NAME": name, "GIT_AUTHOR_EMAIL": email,
+           "GIT_COMMITTER_NAME": name, "GIT_COMMITTER_EMAIL": email}
     
+    # Deferred import: only the commit path needs datetime, and runs
+    # that bail out early ("Nothing to commit") shouldn't pay for it.
+    import datetime
     final_body = f"{commit_msg}\n\nVersion: {next_version}\nTimestamp: {datetime.datetime.now()}"
     run(["git", "commit", "-m", final_body], env=env)
     run(["git", "tag", "-a", next_version, "-m", final_body], env=env)
     
-    if safe(["git", "remote"]):
-        branch = safe(["git", "branch", "--show-current"]) or "main"
-        run(["git", "push", "-u", "origin", branch])
-        run(["git", "push", "origin", next_version])
+    if has_remote():
+        if fetch_proc is not None:
+            fetch_proc.wait()
+        behind = behind_upstream()
+        if behind:
+            warn(f"Local branch is {behind} commit(s) behind upstream; push may be rejected.")
+        branch = current_branch() or "main"
+        # One push carrying both refs: one connection, auth and pack
+        # negotiation instead of two.
+        run(["git", "push", "-u", "origin", branch, next_version])
         success(f"Released {next_version}")
 
 if __name__ == "__main__":
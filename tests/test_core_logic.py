@@ -14,6 +14,23 @@ def test_is_printable_no_space():
     assert not gitgo.is_printable_no_space("abc def")
     assert not gitgo.is_printable_no_space("abc\n")
 
+def test_parse_status_v2():
+    out = "\0".join([
+        "1 M. N... 100644 100644 100644 abc def staged.py",
+        "1 .M N... 100644 100644 100644 abc def dirty.py",
+        "2 R. N... 100644 100644 100644 abc def R100 new.py",
+        "old.py",
+        "? untracked.py",
+        "",
+    ])
+    staged, unstaged, untracked = gitgo._parse_status_v2(out)
+    assert staged == ["staged.py", "new.py"]
+    assert unstaged == ["dirty.py"]
+    assert untracked == ["untracked.py"]
+
+def test_parse_status_v2_empty():
+    assert gitgo._parse_status_v2("") == ([], [], [])
+
 def test_enforce_summary_limit_short():
     msg = "Short summary\n\nBody"
     assert gitgo.enforce_summary_limit(msg) == msg
@@ -1,7 +1,7 @@
 import gitgo.__main__ as gitgo
 import gitgo.__main__ as impl
 
-def test_list_llm_models(monkeypatch):
+def test_list_llm_models(monkeypatch, tmp_path):
     fake_output = """
 Models:
 openai:gpt-4.1
@@ -9,6 +9,8 @@ openai:gpt-4.1-mini
 invalid model name
 """
 
+    monkeypatch.setattr(impl, "LLM_BIN", "/usr/bin/llm")
+    monkeypatch.setattr(impl, "MODELS_CACHE", str(tmp_path / "models.json"))
     monkeypatch.setattr(impl, "safe", lambda _: fake_output)
 
     models = gitgo.list_llm_models()
@@ -17,3 +19,19 @@ invalid model name
     assert "gpt-4.1" in ids
     assert "gpt-4.1-mini" in ids
     assert all(" " not in i for i in ids)
+
+def test_list_llm_models_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(impl, "LLM_BIN", "/usr/bin/llm")
+    monkeypatch.setattr(impl, "MODELS_CACHE", str(tmp_path / "models.json"))
+
+    calls = []
+    def fake_safe(_):
+        calls.append(1)
+        return "openai:gpt-4.1"
+    monkeypatch.setattr(impl, "safe", fake_safe)
+
+    first = gitgo.list_llm_models()
+    second = gitgo.list_llm_models()
+
+    assert first == second
+    assert len(calls) == 1
@@ -12,6 +12,16 @@ class FakeProc:
             return 0
         return None
 
+    def wait(self, timeout=None):
+        left = self.finish_after - (time.time() - self.start)
+        if left <= 0:
+            return 0
+        if timeout is None or timeout >= left:
+            time.sleep(left)
+            return 0
+        time.sleep(timeout)
+        raise subprocess.TimeoutExpired(cmd="fake", timeout=timeout)
+
     def kill(self):
         pass
 
@@ -1,12 +1,11 @@
 import gitgo.__main__ as gitgo
 import gitgo.__main__ as impl
 
-def test_next_free_version(monkeypatch):
+def test_next_free_version():
     existing = {"v1.2.3", "v1.2.4"}
+    assert gitgo.next_free_version(1, 2, 3, existing) == "v1.2.5"
 
-    def fake_tag_exists(tag):
-        return tag in existing
+def test_next_free_version_queries_tags(monkeypatch):
+    monkeypatch.setattr(impl, "list_tags", lambda: {"v0.0.1"})
 
-    monkeypatch.setattr(impl, "tag_exists", fake_tag_exists)
-
-    assert gitgo.next_free_version(1, 2, 3) == "v1.2.5"
+    assert gitgo.next_free_version(0, 0, 0) == "v0.0.2"